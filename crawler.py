@@ -1,21 +1,155 @@
 import os
 import json
+import math
+import queue
+import atexit
 import asyncio
+import hashlib
 import logging
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import List, Dict, Set, Tuple
-from urllib.parse import urljoin, urlparse, urlunparse
+from urllib.parse import urljoin, urlparse
 import re
 
 from playwright.async_api import async_playwright, Page, Browser, TimeoutError
 
+# Grab page text and all hrefs in a single DOM walk and CDP round trip.
+# Non-navigable hrefs are dropped browser-side so they never cross the wire.
+PAGE_PROBE_JS = (
+    "() => ({"
+    "text: document.body.innerText, "
+    "hrefs: Array.from(document.querySelectorAll('a[href]'), a => a.href)"
+    ".filter(h => h && !h.startsWith('javascript:') && !h.startsWith('mailto:') && !h.startsWith('#'))"
+    "})"
+)
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter used to dedup candidate URLs in the frontier.
+
+    A link-rich crawl considers far more URLs than it ever visits, and
+    keeping all of them as Python strings in a set costs tens of MB. The
+    bit array stays constant-size; the false-positive rate just means the
+    odd candidate URL is skipped, which is acceptable for dedup.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        num_bits = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self._num_bits = num_bits
+        self._num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        self._bits = bytearray((num_bits + 7) // 8)
+
+    def _indexes(self, item: str):
+        # Double hashing over one md5 digest gives k independent-enough indexes
+        digest = hashlib.md5(item.encode('utf-8')).digest()
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:], 'big')
+        for i in range(self._num_hashes):
+            yield (h1 + i * h2) % self._num_bits
+
+    def add(self, item: str):
+        for index in self._indexes(item):
+            self._bits[index >> 3] |= 1 << (index & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[index >> 3] & (1 << (index & 7)) for index in self._indexes(item))
+
+class HostRateLimiter:
+    """
+    Paces navigations against a single host.
+
+    Parallel workers on one domain would otherwise fire simultaneous
+    goto calls and trade throughput for 429s and bans. Each worker
+    reserves the next free time slot and sleeps until it arrives, so
+    requests to a host are spaced by at least the configured delay while
+    different domains still run fully in parallel.
+    """
+
+    def __init__(self, delay: float):
+        self._delay = delay
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait_turn(self):
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self._delay
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+class ContextPool:
+    """
+    Bounded pool of warm BrowserContexts shared by all crawl workers.
+
+    Contexts are created once at startup and recycled between crawl units,
+    so the steady state only pays for a fresh Page, not a context bringup.
+    """
+
+    # Resource types that a link-extraction crawler never needs to render.
+    # script/document/xhr/fetch stay allowed since SPAs build their DOM via JS.
+    BLOCKED_RESOURCE_TYPES = {'image', 'imageset', 'font', 'media', 'stylesheet'}
+
+    def __init__(self, browser: Browser, size: int):
+        self._browser = browser
+        self._size = size
+        self._contexts = asyncio.Queue()
+
+    async def start(self):
+        for _ in range(self._size):
+            self._contexts.put_nowait(await self._new_context())
+
+    async def _new_context(self):
+        context = await self._browser.new_context(
+            viewport={'width': 1920, 'height': 1080},
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        )
+        await context.route('**/*', self._filter_route)
+        return context
+
+    async def _filter_route(self, route):
+        if route.request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    @asynccontextmanager
+    async def acquire(self):
+        context = await self._contexts.get()
+        healthy = True
+        try:
+            yield context
+        except Exception:
+            healthy = False
+            raise
+        finally:
+            if not healthy:
+                # The failure may have killed this context; recycling it would
+                # make every future new_page() on it raise. Swap in a fresh one.
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+                context = await self._new_context()
+            self._contexts.put_nowait(context)
+
+    async def close(self):
+        while not self._contexts.empty():
+            await self._contexts.get_nowait().close()
+
 class EcommerceCrawler:
     def __init__(
-        self, 
-        domains: List[str], 
+        self,
+        domains: List[str],
         max_pages_per_domain: int = 500,
         max_depth: int = 10,
         timeout: int = 30000,  # milliseconds
-        headless: bool = True
+        headless: bool = True,
+        workers_per_domain: int = 10,
+        politeness_delay: float = 0.5  # seconds between requests to one host
     ):
         """Initialize with the same parameters as before"""
         self.domains = domains
@@ -23,16 +157,26 @@ class EcommerceCrawler:
         self.max_depth = max_depth
         self.timeout = timeout
         self.headless = headless
+        self.workers_per_domain = workers_per_domain
+        self.politeness_delay = politeness_delay
         
-        # Setup logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler(),
-                logging.FileHandler('crawler_debug.log')
-            ]
-        )
+        # Setup logging: real handlers sit behind a queue drained by a
+        # listener thread, so log writes never block the event loop. Like
+        # basicConfig, this is a no-op if the root logger is already set up.
+        root_logger = logging.getLogger()
+        if not root_logger.handlers:
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            file_handler = RotatingFileHandler('crawler_debug.log', maxBytes=50_000_000, backupCount=3)
+            file_handler.setFormatter(formatter)
+            stream_handler = logging.StreamHandler()
+            stream_handler.setFormatter(formatter)
+
+            log_queue = queue.Queue(-1)
+            root_logger.setLevel(logging.INFO)
+            root_logger.addHandler(QueueHandler(log_queue))
+            self._log_listener = QueueListener(log_queue, file_handler, stream_handler)
+            self._log_listener.start()
+            atexit.register(self._log_listener.stop)
         self.logger = logging.getLogger(__name__)
         
         # URL patterns that indicate a product page
@@ -86,157 +230,183 @@ class EcommerceCrawler:
             '.aspx'
         ]
         
+        # Compile the pattern lists once into single alternation regexes;
+        # one C-level scan replaces N substring checks per classification
+        self._excl_re = re.compile('|'.join(map(re.escape, self.exclusion_patterns)))
+        self._content_re = re.compile('|'.join(map(re.escape, self.product_page_patterns)))
+
+        # Specialize path classification to the configured patterns: generate
+        # a function whose source inlines each pattern as a literal 'in' test,
+        # removing the per-call generator/any()/regex machinery entirely
+        classify_src = (
+            "def classify_path(path):\n"
+            "    if " + " or ".join(f"{p!r} in path" for p in self.exclusion_patterns) + ":\n"
+            "        return False\n"
+            "    return " + " or ".join(f"{p!r} in path" for p in self.product_url_patterns) + "\n"
+        )
+        classify_ns = {}
+        exec(classify_src, classify_ns)
+        self._classify_path = classify_ns['classify_path']
+
+        # Memoize path classification on this instance: the pattern lists are
+        # frozen after __init__ and the same path shapes recur thousands of
+        # times across a site's link graph
+        self.is_product_url_by_path = lru_cache(maxsize=200_000)(self.is_product_url_by_path)
+
         self.output_dir = 'crawler_output'
         os.makedirs(self.output_dir, exist_ok=True)
 
+    def is_product_url_by_path(self, path: str) -> bool:
+        """
+        First step: Check if an already-lowercased URL path matches product patterns
+        """
+        # Exclusions and product patterns are inlined into the generated
+        # predicate built in __init__; results are memoized by lru_cache
+        return bool(self._classify_path(path))
+
     def is_product_url_by_pattern(self, url: str) -> bool:
         """
         First step: Check if URL matches product patterns
         """
+        try:
+            return self.is_product_url_by_path(urlparse(url).path.lower())
+        except Exception as e:
+            self.logger.error(f"Error in is_product_url_by_pattern for {url}: {e}")
+            return False
+
+    def should_fetch(self, url: str) -> bool:
+        """
+        Cheap string-level gate applied before a URL is ever navigated to
+        """
         try:
             parsed_url = urlparse(url)
-            path = parsed_url.path.lower()
-            
-            # Check exclusions first
-            if any(exclusion in path for exclusion in self.exclusion_patterns):
+            if parsed_url.scheme not in ('http', 'https'):
                 return False
-                
-            # Check product URL patterns
-            return any(pattern in path for pattern in self.product_url_patterns)
-            
+            return not self._excl_re.search(parsed_url.path.lower())
         except Exception as e:
-            self.logger.error(f"Error in is_product_url_by_pattern for {url}: {e}")
+            self.logger.error(f"Error in should_fetch for {url}: {e}")
             return False
 
-    async def is_product_page_by_content(self, page: Page) -> bool:
+    def is_product_page_by_content(self, content: str) -> bool:
         """
         Second step: Check page content for product indicators
         """
         try:
-            # Get page text content
-            content = await page.evaluate('() => document.body.innerText')
             content = content.lower()
-            
-            # Count how many product indicators are found
-            indicator_count = sum(1 for pattern in self.product_page_patterns if pattern in content)
-            
-            # If we find at least 3 indicators, consider it a product page
-            return indicator_count >= 3
-            
+
+            # Single linear pass over the text; bail out as soon as 3 distinct
+            # indicators turn up instead of materializing every occurrence
+            indicators = set()
+            for match in self._content_re.finditer(content):
+                indicators.add(match.group())
+                if len(indicators) >= 3:
+                    return True
+            return False
+
         except Exception as e:
             self.logger.error(f"Error in is_product_page_by_content: {e}")
             return False
 
-    async def extract_links(self, page: Page, base_url: str) -> Tuple[Set[str], Set[str]]:
+    def classify_links(self, hrefs: List[str], base_url: str, base_domain: str) -> Tuple[Set[str], Set[str]]:
         """
-        Extract both product and non-product links from a page
+        Sort extracted hrefs into product and non-product links
+
+        base_domain is the normalized netloc of the crawled domain,
+        computed once per crawl in crawl_domain rather than per page.
         """
         product_urls = set()
         non_product_urls = set()
-        
+
         try:
-            links = await asyncio.wait_for(
-                page.query_selector_all('a'),
-                timeout=10
-            )
-            
-            base_domain = urlparse(base_url).netloc.replace('www.', '').replace('shop.', '')
-            
-            for link in links:
+            for href in hrefs:
                 try:
-                    href = await link.get_attribute('href')
-                    if not href or href.startswith('#'):
-                        continue
-                    
+                    # The browser already resolved a.href against the document
+                    # base URL; urljoin stays as a safety net for odd schemes
                     full_url = urljoin(base_url, href)
                     full_url = self.remove_query_params(full_url)
+
+                    # Parse once and reuse the pieces; urlparse is pure Python
+                    # and was the hot spot when called twice per link
                     parsed_url = urlparse(full_url)
-                    
+                    netloc = parsed_url.netloc
+                    if netloc.startswith('www.'):
+                        netloc = netloc[4:]
+                    elif netloc.startswith('shop.'):
+                        netloc = netloc[5:]
+
                     # Only process URLs from the same domain
-                    if parsed_url.netloc.replace('www.', '').replace('shop.', '') == base_domain:
+                    if netloc == base_domain:
                         # First check: URL pattern
-                        if self.is_product_url_by_pattern(full_url):
+                        if self.is_product_url_by_path(parsed_url.path.lower()):
                             product_urls.add(full_url)
                             continue
-                            
+
                         # If not clearly a product URL, we'll add it to non-product URLs
                         # It will be checked for content patterns when visited
                         non_product_urls.add(full_url)
-                
+
                 except Exception as e:
                     self.logger.warning(f"Error processing link on {base_url}: {e}")
-        
-        except asyncio.TimeoutError:
-            self.logger.error(f"Timeout while extracting links from {base_url}")
+
         except Exception as e:
-            self.logger.error(f"Error extracting links from {base_url}: {e}")
+            self.logger.error(f"Error classifying links from {base_url}: {e}")
         
         return product_urls, non_product_urls
 
-    async def crawl_url(self, url: str, page: Page, visited_urls: Set[str], current_depth: int, domain: str) -> Tuple[Set[str], Set[str]]:
+    async def fetch_and_classify(self, page: Page, url: str, base_domain: str) -> Tuple[Set[str], Set[str]]:
         """
-        Crawl a specific URL and its sub-pages recursively
+        Fetch a single URL, classify it, and collect the links it contains
         """
-        url = self.remove_query_params(url)
-
-        if current_depth > self.max_depth or len(visited_urls) >= self.max_pages_per_domain:
-            return set(), visited_urls
-        
-        if url in visited_urls:
-            return set(), visited_urls
-        
         product_urls = set()
-        visited_urls.add(url)
-        
-        current_location = self.get_readable_path(url)
-        self.logger.info(
-            f"{domain}: Crawling {current_location} "
-            f"(Depth: {current_depth}/{self.max_depth}) "
-            f"(Pages: {len(visited_urls)}/{self.max_pages_per_domain})"
-        )
-        
+        non_product_urls = set()
+
         try:
             try:
-                await page.goto(url, timeout=self.timeout, wait_until='networkidle')
-                
-                # Second check: Page content
-                # Only perform content check if URL wasn't already identified as product URL
-                if not self.is_product_url_by_pattern(url) and await self.is_product_page_by_content(page):
-                    product_urls.add(url)
-                
+                # domcontentloaded instead of networkidle: analytics beacons keep
+                # e-commerce pages from ever going network-quiet, and the scroll
+                # loop below already drives lazy-loaded content
+                await page.goto(url, timeout=self.timeout, wait_until='domcontentloaded')
+
+                # Best-effort short window for subresources to settle; anchors are
+                # normally in the DOM already, so never wait the full timeout
+                try:
+                    await page.wait_for_load_state('load', timeout=3000)
+                except TimeoutError:
+                    pass
             except TimeoutError:
                 self.logger.warning(f"Timeout while loading {url}, continuing with partial page load")
-            
+
             try:
-                for i in range(3):
-                    await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                    await page.wait_for_timeout(1000)
+                # Scroll only until the page stops growing (lazy loading done),
+                # with a hard cap instead of a fixed number of 1s sleeps
+                last_height = 0
+                for i in range(5):
+                    height = await page.evaluate(
+                        "() => (window.scrollTo(0, document.body.scrollHeight), document.body.scrollHeight)"
+                    )
+                    if height == last_height:
+                        break
+                    last_height = height
+                    await page.wait_for_timeout(250)
             except Exception as e:
                 self.logger.warning(f"Error during scrolling on {url}: {e}")
-            
-            page_product_urls, page_non_product_urls = await self.extract_links(page, url)
+
+            # Single probe call captures text and links from the same DOM snapshot
+            probe = await page.evaluate(PAGE_PROBE_JS)
+
+            # Second check: Page content
+            # Only perform content check if URL wasn't already identified as product URL
+            if not self.is_product_url_by_pattern(url) and self.is_product_page_by_content(probe['text']):
+                product_urls.add(url)
+
+            page_product_urls, page_non_product_urls = self.classify_links(probe['hrefs'], url, base_domain)
             product_urls.update(page_product_urls)
-            
-            if current_depth < self.max_depth and len(visited_urls) < self.max_pages_per_domain:
-                for non_product_url in page_non_product_urls:
-                    if len(visited_urls) >= self.max_pages_per_domain:
-                        self.logger.info(f"{domain}: Reached maximum pages limit ({self.max_pages_per_domain})")
-                        break
-                    
-                    if non_product_url not in visited_urls:
-                        sub_product_urls, visited_urls = await self.crawl_url(
-                            non_product_url, 
-                            page, 
-                            visited_urls, 
-                            current_depth + 1,
-                            domain
-                        )
-                        product_urls.update(sub_product_urls)
-        
+            non_product_urls.update(page_non_product_urls)
+
         except Exception as e:
             self.logger.error(f"Error crawling {url}: {str(e)}")
-        
-        return product_urls, visited_urls
+
+        return product_urls, non_product_urls
 
     def get_readable_path(self, url: str) -> str:
         """
@@ -253,47 +423,114 @@ class EcommerceCrawler:
 
     def remove_query_params(self, url: str) -> str:
         """
-        Removes query parameters from a given URL.
-        
+        Removes query parameters and fragments from a given URL.
+
         Args:
             url (str): The input URL.
-            
+
         Returns:
             str: The URL without query parameters.
         """
-        parsed_url = urlparse(url)
-        url_without_query = urlunparse((parsed_url.scheme, parsed_url.netloc, parsed_url.path, '', '', ''))
-        return url_without_query
+        # For http(s) URLs everything after '#' or '?' is fragment/query,
+        # so two splits replace the urlparse/urlunparse round trip this
+        # makes per discovered link
+        return url.split('#', 1)[0].split('?', 1)[0]
 
-    async def crawl_domain(self, domain: str, browser: Browser) -> Dict[str, Set[str]]:
+    async def crawl_domain(self, domain: str, pool: ContextPool) -> Dict[str, Set[str]]:
         """
         Crawl a single domain and discover product URLs
+
+        The traversal is an iterative breadth-first search: the frontier
+        queue holds (url, depth) tuples and depth is a BFS level count, so
+        max_depth bounds link distance from the seed rather than a call
+        stack. No Python recursion is involved.
         """
         self.logger.info(f"Starting crawl for domain: {domain}")
         base_url = f'https://{domain}'
         visited_urls = set()
-        
+        product_urls = set()
+
+        # Shared BFS frontier of (url, depth) tuples drained by the workers.
+        # The Bloom filter dedups every candidate URL ever enqueued, while
+        # visited_urls stays an exact set of URLs actually navigated (it is
+        # bounded by max_pages_per_domain and feeds the result JSON).
+        frontier = asyncio.Queue()
+        seen_urls = BloomFilter()
+        rate_limiter = HostRateLimiter(self.politeness_delay)
+
+        # The crawled domain never changes mid-crawl; normalize it once here
+        # instead of once per page in classify_links
+        base_domain = urlparse(base_url).netloc
+        if base_domain.startswith('www.'):
+            base_domain = base_domain[4:]
+        elif base_domain.startswith('shop.'):
+            base_domain = base_domain[5:]
+
+        seed_url = self.remove_query_params(base_url)
+        seen_urls.add(seed_url)
+        frontier.put_nowait((seed_url, 0))
+
+        async def worker():
+            while True:
+                url, depth = await frontier.get()
+                try:
+                    # Re-check under the current state: another worker may have
+                    # visited this URL or exhausted the page budget meanwhile
+                    if url in visited_urls or len(visited_urls) >= self.max_pages_per_domain:
+                        continue
+                    visited_urls.add(url)
+
+                    current_location = self.get_readable_path(url)
+                    self.logger.debug(
+                        f"{domain}: Crawling {current_location} "
+                        f"(Depth: {depth}/{self.max_depth}) "
+                        f"(Pages: {len(visited_urls)}/{self.max_pages_per_domain})"
+                    )
+
+                    await rate_limiter.wait_turn()
+                    async with pool.acquire() as context:
+                        page = await context.new_page()
+                        # Bound evaluate/scroll calls through Playwright's own
+                        # timeout machinery; cancelling its awaitables externally
+                        # (e.g. asyncio.wait_for) desyncs its internal state
+                        page.set_default_timeout(self.timeout)
+                        try:
+                            page_product_urls, page_non_product_urls = await self.fetch_and_classify(page, url, base_domain)
+                        finally:
+                            await page.close()
+                    product_urls.update(page_product_urls)
+
+                    if depth < self.max_depth and len(visited_urls) < self.max_pages_per_domain:
+                        for non_product_url in page_non_product_urls:
+                            if non_product_url not in seen_urls and self.should_fetch(non_product_url):
+                                seen_urls.add(non_product_url)
+                                frontier.put_nowait((non_product_url, depth + 1))
+                except Exception as e:
+                    # Keep the worker alive: a dead worker leaves frontier
+                    # entries undrained and frontier.join() hanging forever
+                    self.logger.error(f"{domain}: Worker error on {url}: {str(e)}")
+                finally:
+                    frontier.task_done()
+
         try:
-            context = await browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            )
-            page = await context.new_page()
-            
-            product_urls, visited_urls = await self.crawl_url(base_url, page, visited_urls, 0, domain)
-            
+            workers = [asyncio.create_task(worker()) for _ in range(self.workers_per_domain)]
+
+            # join() returns once every queued URL has been processed or skipped;
+            # the workers themselves never exit on their own, so cancel them
+            await frontier.join()
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
             self.logger.info(f"\nDomain {domain} crawl completed:")
             self.logger.info(f"- Final pages crawled: {len(visited_urls)} out of {self.max_pages_per_domain} maximum")
             self.logger.info(f"- Product URLs found: {len(product_urls)}\n")
-            
-            await page.close()
-            await context.close()
-            
+
             return {
                 'product_urls': product_urls,
                 'crawled_urls': visited_urls
             }
-            
+
         except Exception as e:
             self.logger.error(f"Fatal error crawling domain {domain}: {str(e)}")
             return {
@@ -303,9 +540,16 @@ class EcommerceCrawler:
 
     async def run_crawler(self):
         """
-        Run crawler for all domains in parallel
+        Run crawler for all domains in parallel, streaming results to disk
+
+        Each domain is written to the NDJSON output files as one line the
+        moment its crawl finishes, so memory stays bounded by a single
+        domain's results and partial output survives a crash mid-run.
         """
         self.logger.info("Starting crawler")
+        product_urls_file = os.path.join(self.output_dir, 'product_urls.ndjson')
+        crawled_urls_file = os.path.join(self.output_dir, 'crawled_urls.ndjson')
+
         async with async_playwright() as p:
             try:
                 browser = await p.chromium.launch(
@@ -317,53 +561,39 @@ class EcommerceCrawler:
                         '--disable-gpu'
                     ]
                 )
-                
-                results = {}
-                tasks = []
-                
-                for domain in self.domains:
-                    task = asyncio.create_task(self.crawl_domain(domain, browser))
-                    tasks.append((domain, task))
-                
-                for domain, task in tasks:
-                    try:
-                        domain_results = await task
-                        results[domain] = {
-                            'product_urls': list(domain_results['product_urls']),
-                            'crawled_urls': list(domain_results['crawled_urls'])
-                        }
-                    except Exception as e:
-                        self.logger.error(f"Error processing {domain}: {str(e)}")
-                
+
+                # Cap the pool so a long domain list doesn't balloon browser memory
+                pool = ContextPool(browser, min(len(self.domains) * self.workers_per_domain, 32))
+                await pool.start()
+
+                # Tag each result with its domain so completion order doesn't matter
+                async def crawl_and_tag(domain):
+                    return domain, await self.crawl_domain(domain, pool)
+
+                tasks = [asyncio.create_task(crawl_and_tag(domain)) for domain in self.domains]
+
+                with open(product_urls_file, 'w') as product_f, open(crawled_urls_file, 'w') as crawled_f:
+                    # as_completed hands back whichever domain finishes first, so a
+                    # slow or hung domain never delays recording the others
+                    for future in asyncio.as_completed(tasks):
+                        try:
+                            domain, domain_results = await future
+                            product_f.write(json.dumps({domain: list(domain_results['product_urls'])}) + '\n')
+                            product_f.flush()
+                            crawled_f.write(json.dumps({domain: list(domain_results['crawled_urls'])}) + '\n')
+                            crawled_f.flush()
+                        except Exception as e:
+                            self.logger.error(f"Error processing domain result: {str(e)}")
+
+                await pool.close()
                 await browser.close()
-                
+
+                self.logger.info(f"Results saved successfully:")
+                self.logger.info(f"- Product URLs: {product_urls_file}")
+                self.logger.info(f"- Crawled URLs: {crawled_urls_file}")
+
             except Exception as e:
                 self.logger.error(f"Fatal error in crawler: {str(e)}")
-                return {}
-            
-        return results
-
-    def save_results(self, results: Dict[str, Dict[str, List[str]]]):
-        """
-        Save crawler results to JSON files
-        """
-        try:
-            product_urls_file = os.path.join(self.output_dir, 'product_urls.json')
-            product_urls = {domain: data['product_urls'] for domain, data in results.items()}
-            with open(product_urls_file, 'w') as f:
-                json.dump(product_urls, f, indent=2)
-            
-            crawled_urls_file = os.path.join(self.output_dir, 'crawled_urls.json')
-            crawled_urls = {domain: data['crawled_urls'] for domain, data in results.items()}
-            with open(crawled_urls_file, 'w') as f:
-                json.dump(crawled_urls, f, indent=2)
-            
-            self.logger.info(f"Results saved successfully:")
-            self.logger.info(f"- Product URLs: {product_urls_file}")
-            self.logger.info(f"- Crawled URLs: {crawled_urls_file}")
-            
-        except Exception as e:
-            self.logger.error(f"Error saving results: {str(e)}")
 
 def main():
     domains = [
@@ -381,8 +611,7 @@ def main():
         headless=False
     )
     
-    results = asyncio.run(crawler.run_crawler())
-    crawler.save_results(results)
+    asyncio.run(crawler.run_crawler())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file